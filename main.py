@@ -3,15 +3,31 @@ Professional Web Scraper for JavaScript-Heavy Websites
 Scrapes skincare products from Qudo Beauty and exports to Excel
 """
 
+import argparse
+import asyncio
+import atexit
+import hashlib
+import json
+import multiprocessing
+import re
 import time
-import pandas as pd
+import aiohttp
+import requests
+from contextlib import nullcontext
+from pathlib import Path
+from aiolimiter import AsyncLimiter
+from ratelimit import limits, sleep_and_retry
+from openpyxl import Workbook
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from multiprocessing import util as mp_util
 import logging
 
 # Configure logging
@@ -21,15 +37,312 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ingredients under their own heading, or after an "Ingredients:" label, in a
+# Shopify body_html; sizes only after a "Size"/"Net" label, so marketing copy
+# such as "natural ingredients" or "each 5g sample" is not picked up
+_INGREDIENTS_BLOCK_RE = re.compile(r'Ingredients[:\s]*</[^>]+>\s*<[^>]+>(.*?)</', re.I | re.S)
+_INGREDIENTS_RE = re.compile(r'Ingredients\s*:\s*(.+?)(?:</|$)', re.I | re.S)
+_SIZE_RE = re.compile(
+    r'\b(?:Size|Net(?:\s*(?:Wt|Weight|Vol|Volume|Contents))?)\.?\s*:?\s*(\d+(?:\.\d+)?\s*(?:ml|oz|g))\b',
+    re.I
+)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Subresources the scraper never reads, blocked in the browser via CDP. Patterns
+# match the whole URL and Shopify assets carry query strings (base.css?v=123),
+# hence the trailing wildcard
+_BLOCKED_URLS = [
+    '*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*',
+    '*.woff*', '*.ttf*', '*.css*',
+    '*google-analytics*', '*googletagmanager*', '*facebook*', '*doubleclick*'
+]
+
+# Returns the page's JSON-LD blocks and, per field, the first selector hit
+_EXTRACT_FIELDS_JS = """
+const fieldSelectors = arguments[0];
+const find = (by, selector) => by === 'xpath'
+    ? document.evaluate(selector, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(selector);
+const result = {};
+for (const [field, selectors] of Object.entries(fieldSelectors)) {
+    for (const [by, selector, attribute] of selectors) {
+        const element = find(by, selector);
+        if (!element) continue;
+        const value = attribute
+            ? element.getAttribute(attribute)
+            : (element.innerText || '').trim();
+        if (value) {
+            result[field] = value;
+            break;
+        }
+    }
+}
+const ldJson = Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    script => script.textContent
+);
+return {ldJson: ldJson, fields: result};
+"""
+
+# Keeps scrolling while the page keeps changing; resolves after 500ms without
+# DOM mutations, once enough product links are present or when the time limit
+# passes, always disconnecting its observer and timer
+_SCROLL_UNTIL_IDLE_JS = """
+const maxProducts = arguments[0];
+const deadline = Date.now() + arguments[1];
+const done = arguments[arguments.length - 1];
+let lastMutation = Date.now();
+const observer = new MutationObserver(() => {
+    lastMutation = Date.now();
+    window.scrollTo(0, document.body.scrollHeight);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);
+const timer = setInterval(() => {
+    const productCount = document.querySelectorAll('a[href*="/products/"]').length;
+    if (Date.now() - lastMutation > 500 || productCount >= maxProducts
+            || Date.now() > deadline) {
+        clearInterval(timer);
+        observer.disconnect();
+        done();
+    }
+}, 100);
+"""
+
+# Returns the href of every node matching an XPath in a single evaluation
+_XPATH_HREFS_JS = """
+const snapshot = document.evaluate(arguments[0], document, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const hrefs = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const href = snapshot.snapshotItem(i).href;
+    if (href) hrefs.push(href);
+}
+return hrefs;
+"""
+
+# Response cache for the JSON endpoint and rendered page cache for Selenium,
+# both kept for a day
+_JSON_CACHE_FILE = 'qudo.sqlite'
+_CACHE_EXPIRY = 86400
+_PAGE_CACHE_DIR = Path('cache')
+
+# Politeness budget for the JSON endpoint: at most 5 requests per second
+_limiter = AsyncLimiter(5, 1)
+
+# Chrome subsystems that cost startup time and CPU without helping scraping
+_CHROME_DISABLE_FLAGS = (
+    '--disable-extensions',
+    '--disable-default-apps',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--disable-client-side-phishing-detection',
+    '--disable-notifications',
+    '--dns-prefetch-disable',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--aggressive-cache-discard'
+)
+
+# Long-lived chromedriver shared by every browser session in this run
+_service = None
+
+
+def _get_service():
+    """Start the shared chromedriver service on first use"""
+    global _service
+    if _service is None:
+        _service = Service(ChromeDriverManager().install())
+        _service.start()
+        atexit.register(_service.stop)
+    return _service
+
+
+def _keep_service_running():
+    """Leave chromedriver running after exit so a later --reuse run can attach"""
+    if _service is not None:
+        atexit.unregister(_service.stop)
+        # Service.__del__ stops the process too, so drop its handle
+        _service.process = None
+
+
+@sleep_and_retry
+@limits(calls=1, period=1)
+def _throttle_page_load():
+    """Block until this process may load another page: one per second per browser"""
+
+
+# Browser session left open by a --reuse run
+_SESSION_FILE = Path.home() / '.qudo_session.json'
+
+
+class _ReuseChrome(webdriver.Remote):
+    """Remote driver that attaches to an existing session instead of creating one"""
+    
+    def __init__(self, command_executor, session_id):
+        self._reuse_session_id = session_id
+        super().__init__(command_executor=command_executor, options=Options())
+    
+    def start_session(self, capabilities):
+        """Adopt the saved session rather than requesting a new one"""
+        self.session_id = self._reuse_session_id
+        self.caps = {'browserName': 'chrome'}
+
 
 class QudobeautyScraper:
     """Scraper class for Qudo Beauty website"""
     
-    def __init__(self, headless=True):
-        """Initialize the scraper with Chrome driver"""
+    # Restart the browser after this many product pages to keep its memory bounded
+    _RECYCLE_AFTER = 25
+    
+    # Column order of the exported sheet
+    _EXPORT_COLUMNS = (
+        'product_name', 'brand', 'category',
+        'ingredients', 'size', 'image_url', 'product_url'
+    )
+    
+    # Skincare category links on the home page
+    _SKINCARE_SELECTORS = (
+        "//a[contains(text(), 'Skincare')]",
+        "//a[contains(text(), 'SKINCARE')]",
+        "//a[contains(@href, 'skincare')]",
+        "//nav//a[contains(text(), 'Skin')]"
+    )
+    
+    # Product links on a collection page
+    _LINK_SELECTORS = (
+        "//a[contains(@href, '/products/')]",
+        "//a[@class and contains(@class, 'product')]",
+        "//div[contains(@class, 'product')]//a",
+        "//article//a"
+    )
+    
+    # Product page fields, tried in order; an optional third item names an attribute
+    _NAME_SELECTORS = (
+        (By.CSS_SELECTOR, "h1.product-title"),
+        (By.CSS_SELECTOR, "h1.product__title"),
+        (By.XPATH, "//h1[contains(@class, 'product')]"),
+        (By.TAG_NAME, "h1"),
+        (By.CSS_SELECTOR, "meta[property='og:title']", 'content')
+    )
+    
+    _CATEGORY_SELECTORS = (
+        (By.CSS_SELECTOR, ".product-type"),
+        (By.CSS_SELECTOR, ".breadcrumb a:last-child"),
+        (By.XPATH, "//span[contains(@class, 'category')]"),
+        (By.XPATH, "//a[contains(@href, 'collections')]")
+    )
+    
+    _INGREDIENT_SELECTORS = (
+        (By.XPATH, "//*[contains(text(), 'Ingredients')]/following-sibling::*"),
+        (By.XPATH, "//*[contains(text(), 'INGREDIENTS')]/following-sibling::*"),
+        (By.CSS_SELECTOR, ".ingredients"),
+        (By.CSS_SELECTOR, "[class*='ingredient']")
+    )
+    
+    _SIZE_SELECTORS = (
+        (By.CSS_SELECTOR, ".product-size"),
+        (By.CSS_SELECTOR, ".variant-option"),
+        (By.XPATH, "//*[contains(text(), 'Size')]/following-sibling::*"),
+        (By.CSS_SELECTOR, "select option[selected]")
+    )
+    
+    # Images are blocked, so prefer the og:image URL
+    _IMAGE_SELECTORS = (
+        (By.CSS_SELECTOR, "meta[property='og:image']", 'content'),
+        (By.CSS_SELECTOR, ".product-image img", 'src'),
+        (By.CSS_SELECTOR, ".product__media img", 'src'),
+        (By.XPATH, "//img[contains(@class, 'product')]", 'src'),
+        (By.CSS_SELECTOR, "img[src*='product']", 'src')
+    )
+    
+    _FIELD_SELECTORS = {
+        'product_name': _NAME_SELECTORS,
+        'category': _CATEGORY_SELECTORS,
+        'ingredients': _INGREDIENT_SELECTORS,
+        'size': _SIZE_SELECTORS,
+        'image_url': _IMAGE_SELECTORS
+    }
+    
+    def __init__(self, headless=True, service_url=None, use_cache=True, reuse=False):
+        """Initialize the scraper; Chrome is only started once it is needed"""
         self.base_url = "https://qudobeauty.com"
         self.products = []
-        self.driver = self._setup_driver(headless)
+        self._col_widths = [len(col) for col in self._EXPORT_COLUMNS]
+        self.use_cache = use_cache
+        self.reuse = reuse
+        self._headless = headless
+        self._service_url = service_url
+        self._driver = None
+        self._pages_loaded = 0
+    
+    @property
+    def driver(self):
+        """Chrome WebDriver, started on first use"""
+        if self._driver is None and self.reuse:
+            self._driver = self._attach_saved_session()
+        if self._driver is None:
+            self._driver = self._setup_driver(self._headless)
+            if self.reuse:
+                self._save_session()
+        return self._driver
+    
+    def close(self):
+        """Quit the Chrome driver if one was started"""
+        if self._driver is None:
+            return
+        if self.reuse:
+            # Keep the browser open for the next --reuse run
+            _keep_service_running()
+        else:
+            self._driver.quit()
+        self._driver = None
+    
+    def _recycle_driver(self):
+        """Replace the browser with a fresh one; the chromedriver service stays up"""
+        logger.info(f"Restarting Chrome after {self._pages_loaded} pages")
+        try:
+            self._driver.quit()
+        except Exception as e:
+            # The browser may already have crashed; start a new one regardless
+            logger.warning(f"Error quitting Chrome during restart: {e}")
+        finally:
+            self._driver = None
+            self._pages_loaded = 0
+    
+    def _save_session(self):
+        """Record the driver's session so a later run can attach to it"""
+        session = {'url': self._service_url, 'sid': self._driver.session_id}
+        _SESSION_FILE.write_text(json.dumps(session), encoding='utf-8')
+    
+    def _attach_saved_session(self):
+        """Attach to the session saved by a previous run, None if it is gone"""
+        try:
+            session = json.loads(_SESSION_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        try:
+            driver = _ReuseChrome(session['url'], session['sid'])
+            driver.current_url  # Fails if the browser or chromedriver has exited
+        except Exception as e:
+            logger.info(f"Saved browser session unavailable, starting a new one: {e}")
+            return None
+        
+        logger.info("Attached to the saved browser session")
+        self._service_url = session['url']
+        return driver
+    
+    def _get_service_url(self):
+        """Return the chromedriver URL, starting the shared service if needed"""
+        if self._service_url is None:
+            self._service_url = _get_service().service_url
+        return self._service_url
         
     def _setup_driver(self, headless):
         """Configure and return Chrome WebDriver"""
@@ -43,43 +356,56 @@ class QudobeautyScraper:
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
+        # Return from get() once the DOM is ready instead of after every subresource
+        chrome_options.page_load_strategy = 'eager'
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Turn off browser subsystems the scraper never uses
+        for flag in _CHROME_DISABLE_FLAGS:
+            chrome_options.add_argument(flag)
+        # Skip image decoding in Blink as well as blocking the requests via CDP
+        chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+        
         # User agent to avoid detection
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.implicitly_wait(10)
+        # Attach to the shared chromedriver instead of booting one per driver
+        driver = webdriver.Remote(command_executor=self._get_service_url(), options=chrome_options)
+        # No implicit polling: a missing element fails fast, known waits are explicit
+        driver.implicitly_wait(0)
+        
+        # Skip images, fonts, stylesheets and trackers; only documents and XHR load
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
         
         return driver
     
     def _wait_for_page_load(self, timeout=15):
-        """Wait for page to fully load"""
+        """Wait for the page DOM to be ready"""
         try:
             WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
+                lambda d: d.execute_script('return document.readyState') != 'loading'
             )
-            time.sleep(2)  # Additional wait for dynamic content
         except TimeoutException:
             logger.warning("Page load timeout, continuing anyway")
     
-    def _safe_find_element(self, by, value, parent=None):
-        """Safely find element and return text or None"""
-        try:
-            element = parent.find_element(by, value) if parent else self.driver.find_element(by, value)
-            return element.text.strip() if element.text else None
-        except NoSuchElementException:
+    def _page_cache_path(self, url):
+        """Return the cache file for a rendered page, None if caching is off"""
+        if not self.use_cache:
             return None
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return (_PAGE_CACHE_DIR / f"{digest}.html").resolve()
     
-    def _safe_get_attribute(self, by, value, attribute, parent=None):
-        """Safely get element attribute or None"""
+    def _page_cache_fresh(self, cache_file):
+        """Whether a cached page exists and is younger than the cache expiry"""
         try:
-            element = parent.find_element(by, value) if parent else self.driver.find_element(by, value)
-            return element.get_attribute(attribute)
-        except NoSuchElementException:
-            return None
+            return time.time() - cache_file.stat().st_mtime < _CACHE_EXPIRY
+        except OSError:
+            return False
     
     def navigate_to_skincare(self):
         """Navigate to skincare products section"""
@@ -89,14 +415,7 @@ class QudobeautyScraper:
         
         try:
             # Look for skincare category link
-            skincare_selectors = [
-                "//a[contains(text(), 'Skincare')]",
-                "//a[contains(text(), 'SKINCARE')]",
-                "//a[contains(@href, 'skincare')]",
-                "//nav//a[contains(text(), 'Skin')]"
-            ]
-            
-            for selector in skincare_selectors:
+            for selector in self._SKINCARE_SELECTORS:
                 try:
                     skincare_link = WebDriverWait(self.driver, 5).until(
                         EC.element_to_be_clickable((By.XPATH, selector))
@@ -117,39 +436,54 @@ class QudobeautyScraper:
             return False
     
     def extract_product_links(self, max_products=30):
-        """Extract product page URLs"""
+        """Extract product page URLs from the collection's JSON endpoint"""
         logger.info("Extracting product links...")
         
-        # Scroll to load more products
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        scroll_attempts = 0
-        max_scrolls = 5
+        try:
+            response = requests.get(
+                f"{self.base_url}/collections/skincare/products.json",
+                params={'limit': min(max_products, 250)},
+                timeout=10
+            )
+            response.raise_for_status()
+            handles = [product['handle'] for product in response.json()['products']]
+        except (requests.RequestException, ValueError, KeyError) as e:
+            logger.warning(f"Collection JSON unavailable ({e}), falling back to the browser")
+            handles = []
         
-        while scroll_attempts < max_scrolls:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if new_height == last_height:
-                break
-            
-            last_height = new_height
-            scroll_attempts += 1
+        if handles:
+            logger.info(f"Found {len(handles)} product links")
+            return [f"{self.base_url}/products/{handle}" for handle in handles[:max_products]]
+        
+        # Not a Shopify collection layout, render and scrape the page instead
+        self.navigate_to_skincare()
+        return self._extract_rendered_product_links(max_products)
+    
+    def _extract_rendered_product_links(self, max_products):
+        """Extract product page URLs from the rendered collection page"""
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.XPATH, self._LINK_SELECTORS[0]))
+            )
+        except TimeoutException:
+            logger.warning("No product links rendered yet, continuing anyway")
+        
+        # Scroll to load more products until the grid settles or is large enough;
+        # the script gives up after 10s, inside the 15s script timeout, so its
+        # observer never outlives the call
+        self.driver.set_script_timeout(15)
+        try:
+            self.driver.execute_async_script(_SCROLL_UNTIL_IDLE_JS, max_products, 10000)
+        except TimeoutException:
+            logger.warning("Product grid still loading after scroll timeout, continuing anyway")
         
         # Find product links using multiple selectors
         product_links = set()
-        link_selectors = [
-            "//a[contains(@href, '/products/')]",
-            "//a[@class and contains(@class, 'product')]",
-            "//div[contains(@class, 'product')]//a",
-            "//article//a"
-        ]
-        
-        for selector in link_selectors:
+        for selector in self._LINK_SELECTORS:
             try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-                for elem in elements:
-                    href = elem.get_attribute('href')
+                # One command per selector instead of one get_attribute per element
+                hrefs = self.driver.execute_script(_XPATH_HREFS_JS, selector)
+                for href in hrefs:
                     if href and '/products/' in href and 'skincare' in href.lower() or len(product_links) < max_products:
                         product_links.add(href)
                         if len(product_links) >= max_products:
@@ -169,8 +503,29 @@ class QudobeautyScraper:
         logger.info(f"Scraping: {url}")
         
         try:
-            self.driver.get(url)
-            self._wait_for_page_load()
+            if self._pages_loaded >= self._RECYCLE_AFTER:
+                self._recycle_driver()
+            
+            cache_file = self._page_cache_path(url)
+            cached = cache_file is not None and self._page_cache_fresh(cache_file)
+            if not cached:
+                _throttle_page_load()
+            self.driver.get(cache_file.as_uri() if cached else url)
+            self._pages_loaded += 1
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, 'h1'))
+                )
+            except TimeoutException:
+                logger.warning(f"No product heading on {url}, continuing anyway")
+            else:
+                # Only cache pages that rendered, not error or half-loaded ones
+                if cache_file is not None and not cached:
+                    cache_file.parent.mkdir(exist_ok=True)
+                    cache_file.write_text(self.driver.page_source, encoding='utf-8')
+            
+            # One WebDriver command for every field instead of one per selector
+            extracted = self.driver.execute_script(_EXTRACT_FIELDS_JS, self._FIELD_SELECTORS)
             
             product_data = {
                 'product_name': None,
@@ -182,90 +537,27 @@ class QudobeautyScraper:
                 'product_url': url
             }
             
-            # Product name
-            name_selectors = [
-                (By.CSS_SELECTOR, "h1.product-title"),
-                (By.CSS_SELECTOR, "h1.product__title"),
-                (By.XPATH, "//h1[contains(@class, 'product')]"),
-                (By.TAG_NAME, "h1")
-            ]
-            
-            for by, selector in name_selectors:
-                product_data['product_name'] = self._safe_find_element(by, selector)
-                if product_data['product_name']:
-                    break
+            # Name, category and image from structured data, selectors for the rest
+            ld_product = self._find_ld_product(extracted['ldJson'])
+            product_data.update(self._parse_ld_product(ld_product))
+            for field, value in extracted['fields'].items():
+                if not product_data[field]:
+                    product_data[field] = value
             
-            # Category/Type
-            category_selectors = [
-                (By.CSS_SELECTOR, ".product-type"),
-                (By.CSS_SELECTOR, ".breadcrumb a:last-child"),
-                (By.XPATH, "//span[contains(@class, 'category')]"),
-                (By.XPATH, "//a[contains(@href, 'collections')]")
-            ]
-            
-            for by, selector in category_selectors:
-                product_data['category'] = self._safe_find_element(by, selector)
-                if product_data['category']:
-                    break
-            
-            # Ingredients
-            ingredient_selectors = [
-                (By.XPATH, "//*[contains(text(), 'Ingredients')]/following-sibling::*"),
-                (By.XPATH, "//*[contains(text(), 'INGREDIENTS')]/following-sibling::*"),
-                (By.CSS_SELECTOR, ".ingredients"),
-                (By.CSS_SELECTOR, "[class*='ingredient']")
-            ]
-            
-            for by, selector in ingredient_selectors:
-                product_data['ingredients'] = self._safe_find_element(by, selector)
-                if product_data['ingredients']:
-                    break
+            # Regexes over the free-text description also match marketing copy,
+            # so they only fill in what the selectors could not find
+            description = ld_product.get('description')
+            if not product_data['ingredients']:
+                product_data['ingredients'] = self._parse_ingredients(description)
+            if not product_data['size']:
+                product_data['size'] = self._parse_size(description)
             
-            # Size/Packaging
-            size_selectors = [
-                (By.CSS_SELECTOR, ".product-size"),
-                (By.CSS_SELECTOR, ".variant-option"),
-                (By.XPATH, "//*[contains(text(), 'Size')]/following-sibling::*"),
-                (By.CSS_SELECTOR, "select option[selected]")
-            ]
-            
-            for by, selector in size_selectors:
-                product_data['size'] = self._safe_find_element(by, selector)
-                if product_data['size']:
-                    break
-            
-            # Product Image
-            image_selectors = [
-                (By.CSS_SELECTOR, ".product-image img"),
-                (By.CSS_SELECTOR, ".product__media img"),
-                (By.XPATH, "//img[contains(@class, 'product')]"),
-                (By.CSS_SELECTOR, "img[src*='product']")
-            ]
-            
-            for by, selector in image_selectors:
-                product_data['image_url'] = self._safe_get_attribute(by, selector, 'src')
-                if product_data['image_url']:
-                    # Ensure full URL
-                    if product_data['image_url'].startswith('//'):
-                        product_data['image_url'] = 'https:' + product_data['image_url']
-                    elif product_data['image_url'].startswith('/'):
-                        product_data['image_url'] = self.base_url + product_data['image_url']
-                    break
-            
-            # Extract additional info from meta tags if needed
-            if not product_data['product_name']:
-                product_data['product_name'] = self._safe_get_attribute(
-                    By.CSS_SELECTOR, 
-                    "meta[property='og:title']", 
-                    'content'
-                )
-            
-            if not product_data['image_url']:
-                product_data['image_url'] = self._safe_get_attribute(
-                    By.CSS_SELECTOR, 
-                    "meta[property='og:image']", 
-                    'content'
-                )
+            # Ensure full image URL
+            image_url = product_data['image_url']
+            if image_url and image_url.startswith('//'):
+                product_data['image_url'] = 'https:' + image_url
+            elif image_url and image_url.startswith('/'):
+                product_data['image_url'] = self.base_url + image_url
             
             return product_data
             
@@ -273,12 +565,140 @@ class QudobeautyScraper:
             logger.error(f"Error scraping product {url}: {e}")
             return None
     
+    def _find_ld_product(self, ld_scripts):
+        """Return the schema.org Product from a page's JSON-LD blocks, {} if none"""
+        for raw in ld_scripts:
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                continue
+            
+            if isinstance(data, dict):
+                graph = data.get('@graph')
+                items = graph if isinstance(graph, list) else [data]
+            elif isinstance(data, list):
+                items = data
+            else:
+                continue
+            
+            for item in items:
+                if isinstance(item, dict) and 'Product' in str(item.get('@type')):
+                    return item
+        return {}
+    
+    def _parse_ld_product(self, ld_product):
+        """Map the name, category and image of a JSON-LD Product onto product fields"""
+        image = ld_product.get('image')
+        if isinstance(image, list):
+            image = image[0] if image else None
+        if isinstance(image, dict):
+            image = image.get('url')
+        
+        fields = {
+            'product_name': ld_product.get('name'),
+            'category': ld_product.get('category'),
+            'image_url': image
+        }
+        return {field: value for field, value in fields.items() if value}
+    
+    def _product_handle(self, url):
+        """Return the Shopify product handle from a product URL"""
+        return url.split('/products/', 1)[-1].split('?', 1)[0].strip('/')
+    
+    def _parse_ingredients(self, body_html):
+        """Extract the ingredients list from a product description"""
+        body_html = body_html or ''
+        for pattern in (_INGREDIENTS_BLOCK_RE, _INGREDIENTS_RE):
+            for match in pattern.finditer(body_html):
+                ingredients = _TAG_RE.sub(' ', match.group(1)).strip(' :\n')
+                if re.search('[A-Za-z]', ingredients):
+                    return ingredients
+        return None
+    
+    def _parse_size(self, body_html):
+        """Extract a size/volume such as '50 ml' from a product description"""
+        match = _SIZE_RE.search(_TAG_RE.sub(' ', body_html or ''))
+        return match.group(1) if match else None
+    
+    async def fetch_product(self, session, handle):
+        """Fetch a product from the Shopify JSON endpoint, None on failure"""
+        url = f"{self.base_url}/products/{handle}"
+        
+        # Only real network fetches count against the rate limit, cache hits don't
+        cached = isinstance(session, CachedSession) and await session.has_url(f"{url}.json")
+        
+        try:
+            async with nullcontext() if cached else _limiter, session.get(f"{url}.json") as response:
+                if response.status != 200:
+                    logger.warning(f"JSON endpoint returned {response.status} for {url}")
+                    return None
+                data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"JSON fetch failed for {url}: {e}")
+            return None
+        
+        product = data.get('product') if isinstance(data, dict) else None
+        if not isinstance(product, dict):
+            logger.warning(f"JSON endpoint returned no product for {url}")
+            return None
+        
+        images = product.get('images') or [{}]
+        variants = product.get('variants') or [{}]
+        body_html = product.get('body_html')
+        
+        # Single-variant products are titled 'Default Title', so read the description
+        size = variants[0].get('title')
+        if not size or size == 'Default Title':
+            size = self._parse_size(body_html)
+        
+        return {
+            'product_name': product.get('title'),
+            'brand': 'Qudo Beauty',
+            'category': product.get('product_type') or None,
+            'ingredients': self._parse_ingredients(body_html),
+            'size': size,
+            'image_url': images[0].get('src'),
+            'product_url': url
+        }
+    
+    async def fetch_products(self, handles):
+        """Fetch all products concurrently from the Shopify JSON endpoint"""
+        connector = aiohttp.TCPConnector(limit=10)
+        timeout = aiohttp.ClientTimeout(total=15)
+        
+        if self.use_cache:
+            cache = SQLiteBackend(_JSON_CACHE_FILE, expire_after=_CACHE_EXPIRY)
+            # Purge stale entries so has_url() only reports responses that will be served
+            await cache.delete_expired_responses()
+            session = CachedSession(cache=cache, connector=connector, timeout=timeout)
+        else:
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        
+        async with session:
+            return await asyncio.gather(
+                *[self.fetch_product(session, handle) for handle in handles]
+            )
+    
+    def scrape_product_pages(self, urls):
+        """Render product pages in a pool of browsers, one driver per process"""
+        processes = min(multiprocessing.cpu_count(), 4, len(urls))
+        logger.info(f"Rendering {len(urls)} product pages with {processes} browsers")
+        
+        pool = multiprocessing.Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(self._headless, self._get_service_url(), self.use_cache)
+        )
+        try:
+            # close/join rather than terminate so workers can quit their drivers
+            return dict(pool.imap_unordered(_scrape_one, urls, chunksize=2))
+        finally:
+            pool.close()
+            pool.join()
+    
     def scrape_products(self, max_products=30):
         """Main scraping method"""
         try:
-            # Navigate to skincare section
-            self.navigate_to_skincare()
-            
             # Get product links
             product_links = self.extract_product_links(max_products)
             
@@ -287,17 +707,25 @@ class QudobeautyScraper:
                 # Try direct URL if available
                 product_links = [f"{self.base_url}/collections/skincare"]
             
-            # Scrape each product
-            for i, link in enumerate(product_links, 1):
+            # Fetch structured product data, no rendering needed
+            handles = [self._product_handle(link) for link in product_links]
+            json_products = asyncio.run(self.fetch_products(handles))
+            
+            # Fall back to the browser for products whose JSON failed
+            fallback_links = [
+                link for link, product_data in zip(product_links, json_products)
+                if product_data is None
+            ]
+            rendered = self.scrape_product_pages(fallback_links) if fallback_links else {}
+            
+            for i, (link, product_data) in enumerate(zip(product_links, json_products), 1):
                 logger.info(f"Progress: {i}/{len(product_links)}")
-                product_data = self.scrape_product_page(link)
+                if product_data is None:
+                    product_data = rendered.get(link)
                 
                 if product_data and product_data['product_name']:
-                    self.products.append(product_data)
+                    self._add_product(product_data)
                     logger.info(f"Successfully scraped: {product_data['product_name']}")
-                
-                # Be respectful - add delay between requests
-                time.sleep(1)
             
             logger.info(f"Scraping complete! Collected {len(self.products)} products")
             
@@ -305,7 +733,13 @@ class QudobeautyScraper:
             logger.error(f"Error during scraping: {e}")
         
         finally:
-            self.driver.quit()
+            self.close()
+    
+    def _add_product(self, product_data):
+        """Record a product and widen its Excel columns as needed"""
+        self.products.append(product_data)
+        for idx, col in enumerate(self._EXPORT_COLUMNS):
+            self._col_widths[idx] = max(self._col_widths[idx], len(str(product_data[col])))
     
     def export_to_excel(self, filename="qudo_beauty_skincare_products.xlsx"):
         """Export scraped data to Excel"""
@@ -313,40 +747,75 @@ class QudobeautyScraper:
             logger.warning("No products to export")
             return
         
-        df = pd.DataFrame(self.products)
+        # Stream rows into a write-only workbook instead of building a DataFrame
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Skincare Products')
         
-        # Reorder columns
-        column_order = [
-            'product_name', 'brand', 'category', 
-            'ingredients', 'size', 'image_url', 'product_url'
-        ]
-        df = df[column_order]
+        # Write-only sheets need column widths before the first row is appended
+        for idx, width in enumerate(self._col_widths):
+            worksheet.column_dimensions[chr(65 + idx)].width = min(width + 2, 50)
         
-        # Export to Excel with formatting
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Skincare Products')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Skincare Products']
-            for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+        worksheet.append(self._EXPORT_COLUMNS)
+        for product in self.products:
+            worksheet.append([product[col] for col in self._EXPORT_COLUMNS])
+        
+        workbook.save(filename)
         
         logger.info(f"Data exported to {filename}")
         print(f"\n✓ Successfully exported {len(self.products)} products to {filename}")
 
 
+# Scraper owned by the current pool worker process
+_worker_scraper = None
+
+
+def _init_worker(headless, service_url, use_cache):
+    """Pool initializer: give each worker process its own Chrome driver"""
+    global _worker_scraper
+    _worker_scraper = QudobeautyScraper(
+        headless=headless,
+        service_url=service_url,
+        use_cache=use_cache
+    )
+    # Pool workers exit without running atexit handlers, use a finalizer instead
+    mp_util.Finalize(None, _quit_worker, exitpriority=10)
+
+
+def _quit_worker():
+    """Shut down the worker's Chrome driver"""
+    _worker_scraper.close()
+
+
+def _scrape_one(url):
+    """Scrape a single product page in a pool worker"""
+    return url, _worker_scraper.scrape_product_page(url)
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Qudo Beauty skincare scraper")
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="fetch every product fresh instead of reading the on-disk cache"
+    )
+    parser.add_argument(
+        '--reuse',
+        action='store_true',
+        help="attach to the browser left open by a previous --reuse run and keep it open"
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("Qudo Beauty Skincare Scraper")
     print("=" * 60)
     
     # Initialize scraper
-    scraper = QudobeautyScraper(headless=True)
+    scraper = QudobeautyScraper(
+        headless=True,
+        use_cache=not args.no_cache,
+        reuse=args.reuse
+    )
     
     # Scrape products
     scraper.scrape_products(max_products=30)
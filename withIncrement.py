@@ -4,7 +4,7 @@ Scrapes skincare products from Qudo Beauty and exports to Excel
 """
 
 import time
-import pandas as pd
+import polars as pl
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -25,6 +25,12 @@ logger = logging.getLogger(__name__)
 class QudobeautyScraper:
     """Scraper class for Qudo Beauty website"""
     
+    # Column order of the exported sheet
+    _EXPORT_COLUMNS = (
+        'product_name', 'brand', 'category',
+        'ingredients', 'size', 'image_url', 'product_url'
+    )
+    
     def __init__(self, headless=True):
         """Initialize the scraper with Chrome driver"""
         self.base_url = "https://qudobeauty.com"
@@ -302,8 +308,8 @@ class QudobeautyScraper:
                 
                 if product_data and product_data['product_name']:
                     # Append to Excel immediately
-                    self.append_to_excel(product_data, filename)
                     self.products.append(product_data)
+                    self.append_to_excel(product_data, filename)
                     
                     print(f"✓ Added: {product_data['product_name']}")
                     print(f"  Category: {product_data.get('category', 'N/A')}")
@@ -330,48 +336,50 @@ class QudobeautyScraper:
     
     def create_excel_file(self, filename):
         """Create Excel file with headers at the start"""
-        column_order = [
-            'product_name', 'brand', 'category', 
-            'ingredients', 'size', 'image_url', 'product_url'
-        ]
-        
         # Create empty DataFrame with columns
-        df = pd.DataFrame(columns=column_order)
+        df = self._products_frame([])
         
         # Export to Excel with formatting
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Skincare Products')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Skincare Products']
-            for idx, col in enumerate(column_order):
-                worksheet.column_dimensions[chr(65 + idx)].width = 20
+        df.write_excel(
+            filename,
+            worksheet='Skincare Products',
+            column_widths=self._column_pixels(20)
+        )
         
         logger.info(f"Excel file created: {filename}")
         print(f"✓ Excel file created: {filename}")
     
+    def _products_frame(self, products):
+        """Build a polars DataFrame of products in export column order"""
+        schema = {col: pl.String for col in self._EXPORT_COLUMNS}
+        return pl.DataFrame(products, schema=schema)
+    
+    def _column_pixels(self, chars):
+        """Convert a width in characters to the pixels polars' write_excel expects"""
+        return int(chars * 7) + 5
+    
     def append_to_excel(self, product_data, filename):
         """Append single product to Excel file immediately"""
         try:
-            # Read existing data
-            df_existing = pd.read_excel(filename, sheet_name='Skincare Products')
-            
-            # Append new product
-            df_new = pd.DataFrame([product_data])
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
+            # Rewrite the sheet from the products collected so far,
+            # no need to read the previous file back in
+            df_combined = self._products_frame(self.products)
+            
+            # Auto-adjust column widths, capped at 50 characters
+            column_widths = {}
+            for col in df_combined.columns:
+                max_length = max(
+                    df_combined[col].fill_null('').str.len_chars().max() or 0,
+                    len(col)
+                )
+                column_widths[col] = self._column_pixels(min(max_length + 2, 50))
             
             # Write back to Excel
-            with pd.ExcelWriter(filename, engine='openpyxl', mode='w') as writer:
-                df_combined.to_excel(writer, index=False, sheet_name='Skincare Products')
-                
-                # Auto-adjust column widths
-                worksheet = writer.sheets['Skincare Products']
-                for idx, col in enumerate(df_combined.columns):
-                    max_length = max(
-                        df_combined[col].astype(str).apply(len).max(),
-                        len(col)
-                    )
-                    worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+            df_combined.write_excel(
+                filename,
+                worksheet='Skincare Products',
+                column_widths=column_widths
+            )
             
             logger.info(f"Added to Excel: {product_data.get('product_name', 'Unknown')}")
             